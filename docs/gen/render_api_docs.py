@@ -6,9 +6,13 @@ it to formatted Markdown documentation.
 """
 
 import argparse
+import functools
+import hashlib
+import json
+import re
 import sys
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     import jsonschema
@@ -22,25 +26,140 @@ except ImportError:
     print("Error: pyyaml package is required. Install with: pip install pyyaml", file=sys.stderr)
     sys.exit(1)
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# orjson is optional; it parses JSON several times faster than the stdlib
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# fastjsonschema is optional; it compiles the schema to Python code and
+# validates much faster than jsonschema's interpreter
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+
+# Key under which a .json copy records the SHA-256 of the YAML it was made from
+SOURCE_DIGEST_KEY = 'x-source-digest'
+
+
+def load_document(path: Path) -> Any:
+    """Load a YAML or JSON document.
+
+    A YAML file is read from its pre-generated .json copy instead when the
+    digest recorded in the copy matches the YAML's current contents.
+    """
+    # Read the whole file in one go; both parsers accept bytes directly
+    raw = path.read_bytes()
+    if path.suffix not in ['.yml', '.yaml']:
+        return json_loads(raw)
+
+    try:
+        data = json_loads(path.with_suffix('.json').read_bytes())
+    except (FileNotFoundError, ValueError):
+        data = None
+    if isinstance(data, dict) and data.pop(SOURCE_DIGEST_KEY, None) == hashlib.sha256(raw).hexdigest():
+        return data
+    return yaml.load(raw, Loader=YAML_LOADER)
+
 
 def load_schema(schema_path: Path) -> Dict[str, Any]:
     """Load schema from file (supports JSON and YAML)."""
-    with open(schema_path) as f:
-        if schema_path.suffix in ['.yml', '.yaml']:
-            return yaml.safe_load(f)
-        else:
-            return json.load(f)
+    return load_document(schema_path)
 
 
 def load_api_data(data_path: Path) -> Dict[str, Any]:
     """Load API reference data from file (supports JSON and YAML)."""
-    with open(data_path) as f:
-        if data_path.suffix in ['.yml', '.yaml']:
-            return yaml.safe_load(f)
-        else:
-            # Fallback to JSON for backwards compatibility
-            import json
-            return json.load(f)
+    return load_document(data_path)
+
+
+def file_digest(path: Path) -> str:
+    """Return a short BLAKE2b digest of a file's contents."""
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+def validation_marker(cache_dir: Path, input_path: Path, schema_path: Path) -> Path:
+    """Return the marker path recording that this input passed this schema."""
+    input_hash = file_digest(input_path)
+    schema_hash = file_digest(schema_path)
+    return cache_dir / f"{input_hash}-{schema_hash}.ok"
+
+
+# Checked schemas and compiled validators, keyed by id() of the schema they
+# were built from. The schema object is kept alongside so its id cannot be
+# reused while cached.
+_CHECKED_SCHEMAS: Dict[int, Tuple[Dict[str, Any], Any]] = {}
+_VALIDATORS: Dict[int, Tuple[Dict[str, Any], Any]] = {}
+_FAST_VALIDATORS: Dict[int, Tuple[Dict[str, Any], Any]] = {}
+
+# fastjsonschema pays ~10ms to compile the schema, which only beats
+# jsonschema's per-item cost from around 75 items upwards
+FAST_VALIDATE_MIN_ITEMS = 100
+
+
+def check_schema(schema: Dict[str, Any]) -> Any:
+    """Check schema against its metaschema once and return its validator class.
+
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    cached = _CHECKED_SCHEMAS.get(id(schema))
+    if cached is None or cached[0] is not schema:
+        validator_cls = jsonschema.validators.validator_for(schema)
+        validator_cls.check_schema(schema)
+        cached = (schema, validator_cls)
+        _CHECKED_SCHEMAS[id(schema)] = cached
+    return cached[1]
+
+
+def get_validator(schema: Dict[str, Any]) -> Any:
+    """Return a validator for schema, building and checking it only once.
+
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    cached = _VALIDATORS.get(id(schema))
+    if cached is None or cached[0] is not schema:
+        cached = (schema, check_schema(schema)(schema))
+        _VALIDATORS[id(schema)] = cached
+    return cached[1]
+
+
+def get_fast_validator(schema: Dict[str, Any]) -> Optional[Any]:
+    """Return a compiled fastjsonschema validator for schema, if available.
+
+    Returns None when fastjsonschema is not installed or cannot compile the
+    schema, in which case callers should use get_validator instead.
+
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    if fastjsonschema is None:
+        return None
+    cached = _FAST_VALIDATORS.get(id(schema))
+    if cached is None or cached[0] is not schema:
+        # Bad schemas fail the same way as on the jsonschema path
+        check_schema(schema)
+        try:
+            compiled = fastjsonschema.compile(schema)
+        except fastjsonschema.JsonSchemaDefinitionException:
+            compiled = None
+        cached = (schema, compiled)
+        _FAST_VALIDATORS[id(schema)] = cached
+    return cached[1]
+
+
+def count_items(data: Any) -> int:
+    """Count items across sections, or 0 if data is not shaped like a reference."""
+    try:
+        return sum(len(section['items']) for section in data['sections'])
+    except (KeyError, TypeError):
+        return 0
 
 
 def validate_json(data: Dict[str, Any], schema: Dict[str, Any]) -> None:
@@ -49,24 +168,41 @@ def validate_json(data: Dict[str, Any], schema: Dict[str, Any]) -> None:
     Raises:
         jsonschema.ValidationError: If validation fails
     """
-    jsonschema.validate(instance=data, schema=schema)
+    if count_items(data) >= FAST_VALIDATE_MIN_ITEMS:
+        fast_validator = get_fast_validator(schema)
+        if fast_validator is not None:
+            try:
+                fast_validator(data)
+                return
+            except fastjsonschema.JsonSchemaValueException:
+                # Re-run with jsonschema below so error messages stay the same
+                pass
+
+    # Same error selection as jsonschema.validate, minus rebuilding the validator
+    error = jsonschema.exceptions.best_match(get_validator(schema).iter_errors(data))
+    if error is not None:
+        raise error
 
 
 def render_parameter(param: Dict[str, str]) -> str:
     """Render a single parameter to markdown."""
-    return f"- **`{param['name']}`**: {param['description']}"
+    return _format_parameter(param['name'], param['description'])
+
+
+@functools.lru_cache(maxsize=None)
+def _format_parameter(name: str, description: str) -> str:
+    """Format a parameter line; shared parameters across items hit the cache."""
+    return f"- **`{name}`**: {description}"
 
 
 def render_parameters(parameters: List[Dict[str, str]]) -> str:
     """Render parameters list to markdown."""
     if not parameters:
         return ""
-
-    lines = ["**Parameters:**\n"]
-    lines.extend(render_parameter(p) for p in parameters)
-    return "\n".join(lines)
+    return "**Parameters:**\n\n" + "\n".join([render_parameter(p) for p in parameters])
 
 
+@functools.lru_cache(maxsize=1024)
 def render_returns(returns: str) -> str:
     """Render returns section to markdown."""
     if not returns:
@@ -76,172 +212,215 @@ def render_returns(returns: str) -> str:
 
 def render_raises(raises: List[str]) -> str:
     """Render raises section to markdown."""
+    return _render_raises(tuple(raises))
+
+
+@functools.lru_cache(maxsize=1024)
+def _render_raises(raises: Tuple[str, ...]) -> str:
+    """Cached body of render_raises; related functions often share a raises list."""
     if not raises:
         return ""
-
-    lines = ["**Raises:**\n"]
-    lines.extend(f"- `{exc}`" for exc in raises)
-    return "\n".join(lines)
+    return "**Raises:**\n\n" + "\n".join([f"- `{exc}`" for exc in raises])
 
 
+@functools.lru_cache(maxsize=1024)
 def render_usage(usage: str) -> str:
     """Render usage example to markdown."""
     if not usage:
         return ""
-
     return f"**Example:**\n\n```python\n{usage}\n```"
 
 
-def render_item(item: Dict[str, Any], section_title: str = "") -> str:
-    """Render a single API item to markdown."""
-    lines = []
+# Markdown for each signature style. "complete" signatures are emitted as-is,
+# "python" signatures get the item name prepended.
+SIGNATURE_TEMPLATES = {
+    'complete': "```\n{sig}\n```\n",
+    'python': "```python\n{name}{sig}\n```\n",
+}
+
+# A signature is already a complete expression if it starts with a paren or
+# contains a dot or a colon, e.g. workflow API items like "Task.run(...)" or
+# "ctx: object". One regex scan instead of three substring searches.
+COMPLETE_SIGNATURE_RE = re.compile(r"^\(|\.|: ")
+
+
+def signature_style(item: Dict[str, Any]) -> str:
+    """Return the item's signature style, inferring it when not declared.
+
+    An unknown declared style (only possible with --no-validate) is ignored.
+    """
+    style = item.get('signature_style')
+    if style in SIGNATURE_TEMPLATES:
+        return style
+    return 'complete' if COMPLETE_SIGNATURE_RE.search(item['signature']) else 'python'
+
 
+def render_item(out: List[str], item: Dict[str, Any], anchor_id: str = "") -> None:
+    """Render a single API item to markdown lines in ``out``."""
     # Header with section prefix and kind badge
     kind_badge = f"`{item['kind']}`"
     # Use HTML anchor for precise control over ID
-    if section_title:
-        from html import escape
-        anchor_id = generate_anchor(f"{section_title} {item['name']}")
-        lines.append(f"### <a id=\"{anchor_id}\"></a>{item['name']} {kind_badge}\n")
+    if anchor_id:
+        out.append(f"### <a id=\"{anchor_id}\"></a>{item['name']} {kind_badge}\n")
     else:
-        lines.append(f"### {item['name']} {kind_badge}\n")
+        out.append(f"### {item['name']} {kind_badge}\n")
 
     # Signature (only include if present)
     if item.get('signature'):
         sig = item['signature']
-        # Check if signature is a complete expression (contains dot, colon, or starts with paren)
-        # This handles workflow API items like "Task.run(...)" or "ctx: object"
-        if '.' in sig or sig.startswith('(') or ': ' in sig:
-            # Already a complete signature, don't prepend name
-            lines.append(f"```\n{sig}\n```\n")
-        else:
-            # Python API style - prepend name to signature
-            lines.append(f"```python\n{item['name']}{sig}\n```\n")
+        template = SIGNATURE_TEMPLATES[signature_style(item)]
+        out.append(template.format(name=item['name'], sig=sig))
 
     # Description
-    lines.append(f"{item['description']}\n")
+    out.append(f"{item['description']}\n")
 
     # Parameters
     if item.get('parameters'):
-        lines.append(render_parameters(item['parameters']))
-        lines.append("")
+        out.append(render_parameters(item['parameters']))
+        out.append("")
 
     # Returns
     if item.get('returns'):
-        lines.append(render_returns(item['returns']))
-        lines.append("")
+        out.append(render_returns(item['returns']))
+        out.append("")
 
     # Raises
     if item.get('raises'):
-        lines.append(render_raises(item['raises']))
-        lines.append("")
+        out.append(render_raises(item['raises']))
+        out.append("")
 
     # Usage example (single string)
     if item.get('usage'):
-        lines.append(render_usage(item['usage']))
-        lines.append("")
+        out.append(render_usage(item['usage']))
+        out.append("")
 
     # Examples (array of Example objects)
     if item.get('examples'):
         if len(item['examples']) == 1:
-            lines.append("**Example:**\n")
+            out.append("**Example:**\n")
         else:
-            lines.append("**Examples:**\n")
+            out.append("**Examples:**\n")
         for example in item['examples']:
             # Reuse section example renderer
-            example_md = render_section_example(example)
-            # Indent the example content slightly
-            lines.append(example_md)
-
-    return "\n".join(lines)
+            render_section_example(out, example)
 
 
-def render_section_example(example: Dict[str, Any]) -> str:
-    """Render a single section example to markdown."""
-    lines = []
-
+def render_section_example(out: List[str], example: Dict[str, Any]) -> None:
+    """Render a single section example to markdown lines in ``out``."""
     if example.get('title'):
-        lines.append(f"**{example['title']}**")
+        out.append(f"**{example['title']}**")
 
     if example.get('description'):
-        lines.append(f"{example['description']}\n")
-
-    lines.append(f"```python\n{example['code']}\n```\n")
-
-    return "\n".join(lines)
+        out.append(f"{example['description']}\n")
 
+    out.append(f"```python\n{example['code']}\n```\n")
 
-def render_section(section: Dict[str, Any]) -> str:
-    """Render a section with all its items to markdown."""
-    lines = []
 
+def render_section(out: List[str], section: Dict[str, Any], anchors: Dict[int, str]) -> None:
+    """Render a section with all its items to markdown lines in ``out``."""
     # Section header
-    lines.append(f"## {section['title']}\n")
+    out.append(f"## {section['title']}\n")
 
     # Section description if present
     if section.get('description'):
-        lines.append(f"{section['description']}\n")
+        out.append(f"{section['description']}\n")
 
     # Section examples if present
     if section.get('examples'):
         for example in section['examples']:
-            lines.append(render_section_example(example))
+            render_section_example(out, example)
 
-    # Render each item with section title for anchor generation
+    # Render each item with its precomputed anchor
     items = section['items']
     for i, item in enumerate(items):
-        lines.append(render_item(item, section['title']))
+        render_item(out, item, anchors[id(item)])
         # Add subtle divider between items (but not after the last one)
         if i < len(items) - 1:
-            lines.append("* * *\n")
+            out.append("* * *\n")
 
-    return "\n".join(lines)
 
+# Anything but word characters (str.isalnum() plus underscore), dots and hyphens
+ANCHOR_STRIP_RE = re.compile(r"[^\w.-]+")
 
+
+@functools.lru_cache(maxsize=None)
 def generate_anchor(text: str) -> str:
     """Generate markdown anchor link from text."""
     # GitHub-flavored markdown anchor: lowercase, spaces to dots, remove special chars
     anchor = text.lower().replace(' ', '.')
     # Remove any non-alphanumeric characters except dots, hyphens and underscores
-    anchor = ''.join(c for c in anchor if c.isalnum() or c in '.-_')
-    return anchor
+    return ANCHOR_STRIP_RE.sub('', anchor)
+
 
+def build_anchor_map(data: Dict[str, Any]) -> Dict[int, str]:
+    """Compute anchors for every section and item, keyed by id() of the object."""
+    anchors = {}
+    for section in data['sections']:
+        anchors[id(section)] = generate_anchor(section['title'])
+        for item in section['items']:
+            # Prefix item with section name to avoid conflicts
+            anchors[id(item)] = generate_anchor(f"{section['title']} {item['name']}")
+    return anchors
 
-def render_table_of_contents(data: Dict[str, Any]) -> str:
+
+def render_table_of_contents(
+    out: List[str], data: Dict[str, Any], anchors: Dict[int, str]
+) -> None:
     """Generate table of contents with links to sections and items."""
-    lines = ["### Table of Contents\n"]
+    out.append("### Table of Contents\n")
 
     for section in data['sections']:
-        section_anchor = generate_anchor(section['title'])
-        lines.append(f"- [{section['title']}](#{section_anchor})")
+        out.append(f"- [{section['title']}](#{anchors[id(section)]})")
 
         # Add items within this section
         for item in section['items']:
-            # Prefix item with section name to avoid conflicts
-            item_header_text = f"{section['title']} {item['name']}"
-            item_anchor = generate_anchor(item_header_text)
-            lines.append(f"  - [{item['name']}](#{item_anchor})")
+            out.append(f"  - [{item['name']}](#{anchors[id(item)]})")
 
-    lines.append("")  # Empty line after TOC
-    return "\n".join(lines)
+    out.append("")  # Empty line after TOC
 
 
-def render_to_markdown(data: Dict[str, Any]) -> str:
-    """Render the entire API reference to markdown."""
-    lines = []
+def render_markdown_lines(data: Dict[str, Any]) -> List[str]:
+    """Render the entire API reference to a list of markdown lines.
+
+    Every renderer appends to one shared list.
+    """
+    out: List[str] = []
+    # Anchors are shared by the table of contents and the item headers
+    anchors = build_anchor_map(data)
 
     # Document title and summary
-    lines.append(f"# {data['title']}\n")
-    lines.append(f"{data['summary']}\n")
+    out.append(f"# {data['title']}\n")
+    out.append(f"{data['summary']}\n")
 
     # Table of contents
-    lines.append(render_table_of_contents(data))
+    render_table_of_contents(out, data, anchors)
 
     # Render each section
     for section in data['sections']:
-        lines.append(render_section(section))
+        render_section(out, section, anchors)
+
+    return out
+
+
+def render_to_markdown(data: Dict[str, Any]) -> str:
+    """Render the entire API reference to markdown."""
+    return "\n".join(render_markdown_lines(data))
 
-    return "\n".join(lines)
+
+def write_markdown(path: Path, lines: List[str]) -> None:
+    """Write rendered lines to path as UTF-8.
+
+    Lines are encoded straight into one byte buffer, so the document is never
+    held as a joined str as well as its encoded bytes.
+    """
+    buf = bytearray()
+    for line in lines:
+        buf += line.encode('utf-8')
+        buf += b"\n"
+    # Lines are newline-separated, not terminated
+    if buf:
+        del buf[-1:]
+    path.write_bytes(buf)
 
 
 def main():
@@ -270,6 +449,17 @@ def main():
         action="store_true",
         help="Skip schema validation"
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=Path(__file__).parent / ".docs_cache",
+        help="Directory for validation markers (default: .docs_cache in script directory)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always validate, ignoring markers from previous successful runs"
+    )
 
     args = parser.parse_args()
 
@@ -292,24 +482,36 @@ def main():
             print(f"Warning: Schema file not found: {args.schema}", file=sys.stderr)
             print("Skipping validation...", file=sys.stderr)
         else:
-            print(f"Validating against schema {args.schema}...")
-            try:
-                schema = load_schema(args.schema)
-                validate_json(api_data, schema)
-                print("✓ Validation successful")
-            except jsonschema.ValidationError as e:
-                print(f"Error: Validation failed: {e.message}", file=sys.stderr)
-                print(f"Path: {' -> '.join(str(p) for p in e.path)}", file=sys.stderr)
-                sys.exit(1)
+            marker = None if args.no_cache else validation_marker(
+                args.cache_dir, args.input_file, args.schema
+            )
+            if marker is not None and marker.exists():
+                print("✓ Validation skipped (input and schema unchanged since last success)")
+            else:
+                print(f"Validating against schema {args.schema}...")
+                try:
+                    schema = load_schema(args.schema)
+                    validate_json(api_data, schema)
+                    print("✓ Validation successful")
+                except jsonschema.ValidationError as e:
+                    print(f"Error: Validation failed: {e.message}", file=sys.stderr)
+                    print(f"Path: {' -> '.join(str(p) for p in e.path)}", file=sys.stderr)
+                    sys.exit(1)
+
+                if marker is not None:
+                    try:
+                        marker.parent.mkdir(parents=True, exist_ok=True)
+                        marker.touch()
+                    except OSError as e:
+                        print(f"Warning: Could not write validation marker: {e}", file=sys.stderr)
 
     # Render to markdown
     print("Rendering to Markdown...")
-    markdown = render_to_markdown(api_data)
+    lines = render_markdown_lines(api_data)
 
     # Write output
     args.output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(args.output_file, 'w') as f:
-        f.write(markdown)
+    write_markdown(args.output_file, lines)
 
     print(f"✓ Generated: {args.output_file}")
     print(f"  Sections: {len(api_data['sections'])}")
@@ -5,7 +5,6 @@ Worker entry point for the simple application.
 Starts a worker that processes tasks and workflows.
 """
 
-import asyncio
 import logging
 import os
 
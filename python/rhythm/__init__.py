@@ -2,10 +2,17 @@
 Rhythm - A lightweight durable execution framework using only Postgres
 """
 
-from rhythm import client, worker
-from rhythm.decorators import task
+import importlib
+from typing import TYPE_CHECKING
+
+# Bound eagerly: the rhythm.init submodule shares this name, and importing it
+# would shadow a lazily resolved attribute with the module object
 from rhythm.init import init
 
+if TYPE_CHECKING:
+    from rhythm import client, worker
+    from rhythm.decorators import task
+
 __all__ = [
     "init",
     "task",
@@ -14,3 +21,27 @@ __all__ = [
 ]
 
 __version__ = "0.1.0"
+
+# Public attributes resolved on first access (PEP 562)
+_LAZY_ATTRS = {
+    "task": ("rhythm.decorators", "task"),
+    "worker": ("rhythm.worker", None),
+    "client": ("rhythm.client", None),
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    module = importlib.import_module(module_name)
+    value = module if attr is None else getattr(module, attr)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
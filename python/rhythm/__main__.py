@@ -5,7 +5,7 @@ This module provides a thin wrapper around the Rust CLI implementation.
 All CLI logic is implemented in Rust core for consistency across language adapters.
 """
 
-import asyncio
+import importlib
 import os
 import sys
 
@@ -29,27 +29,34 @@ def main(database_url, config):
 @click.option("-m", "--import", "import_modules", multiple=True, help="Module to import")
 def worker(queues, worker_id, import_modules):
     """Run a worker to process tasks"""
-    # Import modules to register decorated functions
-    for module_name in import_modules:
-        try:
-            __import__(module_name)
-            click.echo(f"Imported module: {module_name}")
-        except ImportError as e:
-            click.echo(f"Failed to import {module_name}: {e}", err=True)
-            sys.exit(1)
-
-    click.echo(f"Starting worker for queues: {', '.join(queues)}")
+    # Import modules to register decorated functions (each name once, in order)
+    lines = []
+    try:
+        for module_name in dict.fromkeys(import_modules):
+            try:
+                importlib.import_module(module_name)
+            except ImportError as e:
+                failure = f"Failed to import {module_name}: {e}"
+                break
+            lines.append(f"Imported module: {module_name}")
+        else:
+            failure = None
+            lines.append(f"Starting worker for queues: {', '.join(queues)}")
+    finally:
+        # Startup messages go out in a single write, which still reports the
+        # modules that did import when a later one fails in any way
+        if lines:
+            click.echo("\n".join(lines))
 
-    from rhythm.worker import run_worker
+    if failure is not None:
+        click.echo(failure, err=True)
+        sys.exit(1)
 
-    async def _run():
-        try:
-            await run_worker()
-        except KeyboardInterrupt:
-            click.echo("\nShutting down worker...")
+    # Imported here so that --help and other commands never load the Rust extension
+    from rhythm.worker import run
 
     try:
-        asyncio.run(_run())
+        run()
     except KeyboardInterrupt:
         click.echo("\nInterrupted")
         sys.exit(130)
@@ -10,6 +10,14 @@ except ImportError:
 
 from rhythm.models import DelegatedAction, Execution
 
+# orjson is optional; it decodes several times faster than the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 class RhythmCore:
     """Rhythm core interface for managing executions and workflows"""
@@ -74,7 +82,7 @@ class RhythmCore:
         Returns a DelegatedAction indicating what the host should do.
         """
         result = rust.run_cooperative_worker_loop()
-        data = json.loads(result)
+        data = _json_loads(result)
         return DelegatedAction.from_dict(data)
 
     @staticmethod
@@ -112,7 +120,7 @@ class RhythmCore:
         """Get execution by ID"""
         result = rust.get_execution_sync(execution_id=execution_id)
         if result:
-            data = json.loads(result)
+            data = _json_loads(result)
             return Execution.from_dict(data)
         return None
 
@@ -120,7 +128,7 @@ class RhythmCore:
     def get_workflow_tasks(workflow_id: str) -> List[Dict[str, Any]]:
         """Get workflow child tasks"""
         result = rust.get_workflow_tasks_sync(workflow_id=workflow_id)
-        return json.loads(result)
+        return _json_loads(result)
 
     @staticmethod
     def start_workflow(workflow_name: str, inputs: dict) -> str:
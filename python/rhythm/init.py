@@ -2,10 +2,30 @@
 Initialization for Rhythm workflows
 """
 
+import os
 from pathlib import Path
 from typing import List, Optional
 
-from rhythm.core import RhythmCore
+
+def _find_flow_files(root: Path) -> List[Path]:
+    """Recursively collect .flow files under root"""
+    found = []
+    stack = [str(root)]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.endswith(".flow") and entry.is_file():
+                        found.append(Path(entry.path))
+        except PermissionError:
+            # Unreadable directories are skipped, as Path.rglob does
+            continue
+        # Visit subdirectories in the order they were listed
+        stack.extend(reversed(subdirs))
+    return found
 
 
 def init(
@@ -26,6 +46,9 @@ def init(
     Meta:
         section: Initialization
     """
+    # Imported here so that importing rhythm does not load the native extension
+    from rhythm.core import RhythmCore
+
     workflow_paths = workflow_paths or []
 
     # Scan for .flow files and read their contents if paths provided
@@ -42,17 +65,16 @@ def init(
                 raise ValueError(f"Workflow path is not a directory: {path}")
 
         # Scan for .flow files
-        for path in paths:
-            for flow_file in path.rglob("*.flow"):
-                workflow_name = flow_file.stem  # filename without extension
-                workflow_source = flow_file.read_text()
-                workflows.append(
-                    {
-                        "name": workflow_name,
-                        "source": workflow_source,
-                        "file_path": str(flow_file),
-                    }
-                )
+        flow_files = [f for path in paths for f in _find_flow_files(path)]
+
+        for flow_file in flow_files:
+            workflows.append(
+                {
+                    "name": flow_file.stem,  # filename without extension
+                    "source": flow_file.read_text(encoding="utf-8"),
+                    "file_path": str(flow_file),
+                }
+            )
 
         if workflows:
             print(f"Found {len(workflows)} workflow(s)")
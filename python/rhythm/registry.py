@@ -1,5 +1,6 @@
 """Function registry for looking up decorated functions"""
 
+import inspect
 from typing import Callable, Dict
 
 # Global registry of target_name -> function
@@ -7,17 +8,22 @@ _FUNCTION_REGISTRY: Dict[str, Callable] = {}
 
 
 def register_function(name: str, fn: Callable):
-    """Register a function in the global registry"""
+    """Register a function in the global registry
+
+    Only sync functions are supported, so async ones are rejected here once
+    rather than on every execution.
+    """
+    if inspect.iscoroutinefunction(fn):
+        raise TypeError(f"Async functions not supported: {name}")
     _FUNCTION_REGISTRY[name] = fn
 
 
 def get_function(name: str, required: bool = True) -> Callable:
     """Get a function from the registry"""
-    if name not in _FUNCTION_REGISTRY:
-        if required:
-            raise ValueError(f"Function '{name}' not found in registry. Did you import it?")
-        return None
-    return _FUNCTION_REGISTRY[name]
+    fn = _FUNCTION_REGISTRY.get(name)
+    if fn is None and required:
+        raise ValueError(f"Function '{name}' not found in registry. Did you import it?")
+    return fn
 
 
 def clear_registry():
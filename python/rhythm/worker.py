@@ -1,6 +1,5 @@
 """Worker implementation for executing tasks and workflows"""
 
-import asyncio
 import logging
 import signal
 import time
@@ -11,6 +10,9 @@ from rhythm.registry import get_function
 
 logger = logging.getLogger(__name__)
 
+# Deepest frames kept in the traceback stored with a failed execution
+MAX_TRACEBACK_FRAMES = 30
+
 
 def _handle_shutdown_signal(signum, frame):
     """Signal handler for graceful shutdown"""
@@ -60,25 +62,26 @@ def run():
                     f"Received task: {action.target_name} (execution {action.execution_id})"
                 )
 
-                # Execute the task synchronously
+                # Execute the task synchronously (async functions are rejected at registration)
                 fn = get_function(action.target_name)
 
-                # Only support sync functions
-                if asyncio.iscoroutinefunction(fn):
-                    raise TypeError(f"Async functions not supported: {action.target_name}")
-
                 logger.debug(f"Executing sync function {action.target_name}")
                 try:
                     result = fn(**action.inputs)
                 except Exception as e:
-                    logger.error(
-                        f"Error executing {action.execution_id}: {e}\n{traceback.format_exc()}"
+                    # Format once for both the log and the stored error
+                    tb = "".join(
+                        traceback.format_exception(
+                            type(e), e, e.__traceback__, limit=-MAX_TRACEBACK_FRAMES
+                        )
                     )
+                    # Lazy %-style args so nothing is interpolated if the record is filtered out
+                    logger.error("Error executing %s: %s\n%s", action.execution_id, e, tb)
 
                     error_data = {
                         "message": str(e),
                         "type": type(e).__name__,
-                        "traceback": traceback.format_exc(),
+                        "traceback": tb,
                     }
 
                     # Report the failure
@@ -4,7 +4,9 @@
 Extracts API metadata from Python source code to YAML format.
 """
 
+import hashlib
 import inspect
+import json
 import re
 from typing import Any, Dict, List, Optional
 from pathlib import Path
@@ -26,6 +28,9 @@ import rhythm.decorators as decorators_module
 from importlib import import_module
 init_module = import_module('rhythm.init')
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # These will be populated from supplemental docs YAML
 VALID_SECTIONS = set()
 SECTION_ORDER = []
@@ -34,8 +39,7 @@ SUPPLEMENTAL_DOCS = {}
 
 def load_supplemental_docs(yaml_path: Path) -> Dict[str, Any]:
     """Load supplemental documentation content from YAML file."""
-    with open(yaml_path) as f:
-        return yaml.safe_load(f)
+    return yaml.load(yaml_path.read_bytes(), Loader=YAML_LOADER)
 
 
 def initialize_from_supplemental_docs(docs: Dict[str, Any]) -> None:
@@ -323,7 +327,16 @@ def main():
     with open(yaml_path, 'w') as f:
         yaml.dump(api_doc, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
+    # Save a JSON copy stamped with the YAML's digest; the renderer loads it
+    # in place of the YAML only while the digest still matches
+    json_path = output_dir / "python-api.json"
+    json_doc = {**api_doc, 'x-source-digest': hashlib.sha256(yaml_path.read_bytes()).hexdigest()}
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(json_doc, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+
     print(f"\n✓ Generated: {yaml_path}")
+    print(f"✓ Generated: {json_path}")
     print(f"\nExtracted {len(sections)} sections with {len(all_items)} total items:")
     for section in sections:
         print(f"  - {section['title']}: {len(section['items'])} items")